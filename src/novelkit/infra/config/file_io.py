@@ -6,6 +6,7 @@
 from typing import Any
 
 from novelkit.infra.paths import DEFAULT_CONFIG_FILE, SETTING_PATH
+from novelkit.libs.filesystem import atomic_write_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -144,6 +145,9 @@ def save_config(
     """
     Save configuration data to disk in JSON format.
 
+    The file is replaced atomically, so an interrupted write never leaves a
+    truncated config behind.
+
     Args:
         config: Parsed configuration dictionary.
         output_path: Destination path for the JSON file.
@@ -155,8 +159,8 @@ def save_config(
     output.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        with output.open("w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        content = json.dumps(config, indent=2, ensure_ascii=False)
+        atomic_write_bytes(output, content.encode("utf-8"))
     except Exception as e:
         logger.error("Failed to write config JSON '%s': %s", output, e)
         raise
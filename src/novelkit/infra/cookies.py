@@ -6,9 +6,29 @@
 
 import json
 from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=128)
+def _parse_cookie_string(cookies: str) -> tuple[tuple[str, str], ...]:
+    """Split a ``"k1=v1; k2=v2"`` cookie string into stripped key/value pairs.
+
+    Results are cached, so re-parsing the same configured cookie string
+    (e.g. on every login) is a single dict lookup.
+    """
+    pairs: list[tuple[str, str]] = []
+    for part in cookies.split(";"):
+        key, sep, value = part.partition("=")
+        if not sep:
+            continue
+        key = key.strip()
+        if not key:
+            continue
+        pairs.append((key, value.strip()))
+    return tuple(pairs)
+
+
 def parse_cookies(cookies: str | Mapping[str, str]) -> dict[str, str]:
     """Parse cookies from a string or mapping into a normalized dictionary.
 
@@ -28,16 +48,7 @@ def parse_cookies(cookies: str | Mapping[str, str]) -> dict[str, str]:
         TypeError: If ``cookies`` is neither a string nor a mapping.
     """
     if isinstance(cookies, str):
-        result: dict[str, str] = {}
-        for part in cookies.split(";"):
-            if "=" not in part:
-                continue
-            key, value = part.split("=", 1)
-            key, value = key.strip(), value.strip()
-            if not key:
-                continue
-            result[key] = value
-        return result
+        return dict(_parse_cookie_string(cookies))
     elif isinstance(cookies, Mapping):
         return {str(k).strip(): str(v).strip() for k, v in cookies.items()}
     raise TypeError("Unsupported cookie format: must be str or dict-like")
@@ -12,12 +12,13 @@
 __all__ = ["ChapterStorage"]
 
 import contextlib
-import json
 import sqlite3
 import types
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Any, Self
 
+from novelkit.libs.json import dumps, loads
 from novelkit.schemas import ChapterDict
 
 _CREATE_TABLE_SQL = """
@@ -30,6 +31,24 @@
 );
 """
 
+# Connection tuning: WAL lets readers proceed during writes and, together with
+# synchronous=NORMAL, avoids an fsync on every commit.
+_PRAGMAS_SQL = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-65536;
+PRAGMA mmap_size=268435456;
+"""
+
+# Max ids bound per `IN (...)` clause; stays below SQLITE_MAX_VARIABLE_NUMBER
+# (999 on SQLite builds older than 3.32)
+_IN_CHUNK_SIZE = 900
+
+
+def _placeholders(n: int) -> str:
+    return ",".join("?" * n)
+
 
 class ChapterStorage:
     """SQLite-backed storage for novel chapters.
@@ -49,6 +68,8 @@ def __init__(self, db_path: str | Path) -> None:
         self._conn: sqlite3.Connection | None = None
         # Cache: chapter id -> need_refetch flag
         self._refetch_flags: dict[str, bool] = {}
+        # Nesting depth of `transaction()` blocks; commits are deferred while > 0
+        self._tx_depth = 0
 
     def connect(self) -> None:
         """Open the SQLite connection and initialize schema/cache."""
@@ -57,6 +78,7 @@ def connect(self) -> None:
 
         self._conn = sqlite3.connect(self._db_path)
         self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(_PRAGMAS_SQL)
         self._conn.executescript(_CREATE_TABLE_SQL)
         self._conn.commit()
         self._load_existing_keys()
@@ -85,6 +107,22 @@ def need_refetch(self, chap_id: str) -> bool:
         """
         return self._refetch_flags.get(chap_id, True)
 
+    def need_refetch_many(self, chap_ids: Iterable[str]) -> set[str]:
+        """Return the subset of chapter IDs that must be refetched.
+
+        Equivalent to calling :meth:`need_refetch` for each ID, but answered
+        in one pass over the in-memory flag cache, so callers can plan a whole
+        batch up front. Unknown IDs are included.
+
+        Args:
+            chap_ids: Chapter identifiers to check.
+
+        Returns:
+            A set of chapter IDs that require refetching or are unknown.
+        """
+        flags = self._refetch_flags
+        return {cid for cid in chap_ids if flags.get(cid, True)}
+
     def existing_ids(self) -> set[str]:
         """Return all chapter IDs currently stored.
 
@@ -119,7 +157,7 @@ def upsert_chapter(self, data: ChapterDict, need_refetch: bool = False) -> None:
         chap_id = data["id"]
         title = data["title"]
         content = data["content"]
-        extra_json = json.dumps(data["extra"], ensure_ascii=False)
+        extra_json = dumps(data["extra"])
 
         self.conn.execute(
             """
@@ -133,7 +171,7 @@ def upsert_chapter(self, data: ChapterDict, need_refetch: bool = False) -> None:
             """,
             (chap_id, title, content, int(need_refetch), extra_json),
         )
-        self.conn.commit()
+        self._commit()
         self._refetch_flags[chap_id] = need_refetch
 
     def upsert_chapters(
@@ -153,7 +191,7 @@ def upsert_chapters(
             chap_id = chapter["id"]
             title = chapter["title"]
             content = chapter["content"]
-            extra_json = json.dumps(chapter["extra"], ensure_ascii=False)
+            extra_json = dumps(chapter["extra"])
             records.append((chap_id, title, content, int(need_refetch), extra_json))
             self._refetch_flags[chap_id] = need_refetch
 
@@ -169,7 +207,7 @@ def upsert_chapters(
             """,
             records,
         )
-        self.conn.commit()
+        self._commit()
 
     def get_chapter(self, chap_id: str) -> ChapterDict | None:
         """Retrieve a single chapter by ID.
@@ -196,7 +234,11 @@ def get_chapter(self, chap_id: str) -> ChapterDict | None:
         )
 
     def get_chapters(self, chap_ids: list[str]) -> dict[str, ChapterDict | None]:
-        """Retrieve multiple chapters by ID in a single query.
+        """Retrieve multiple chapters by ID.
+
+        IDs are looked up with one ``IN (...)`` query per chunk of at most
+        900 IDs, so arbitrarily large batches stay within SQLite's bound
+        parameter limit.
 
         Args:
             chap_ids: List of chapter identifiers.
@@ -207,24 +249,59 @@ def get_chapters(self, chap_ids: list[str]) -> dict[str, ChapterDict | None]:
         if not chap_ids:
             return {}
 
-        placeholders = ",".join("?" for _ in chap_ids)
-        query = f"""
-            SELECT id, title, content, extra
-              FROM chapters
-             WHERE id IN ({placeholders})
-        """
-        rows = self.conn.execute(query, tuple(chap_ids)).fetchall()
-
         result: dict[str, ChapterDict | None] = dict.fromkeys(chap_ids)
-        for row in rows:
-            result[row["id"]] = ChapterDict(
-                id=row["id"],
-                title=row["title"],
-                content=row["content"],
-                extra=self._load_dict(row["extra"]),
-            )
+        unique_ids = list(result)
+        conn = self.conn
+        for i in range(0, len(unique_ids), _IN_CHUNK_SIZE):
+            chunk = unique_ids[i : i + _IN_CHUNK_SIZE]
+            query = f"""
+                SELECT id, title, content, extra
+                  FROM chapters
+                 WHERE id IN ({_placeholders(len(chunk))})
+            """
+            for row in conn.execute(query, chunk):
+                result[row["id"]] = ChapterDict(
+                    id=row["id"],
+                    title=row["title"],
+                    content=row["content"],
+                    extra=self._load_dict(row["extra"]),
+                )
         return result
 
+    def iter_chapters(
+        self, chap_ids: list[str], batch_size: int = 200
+    ) -> Iterator[tuple[str, ChapterDict | None]]:
+        """Iterate over chapters by ID without loading them all at once.
+
+        Chapters are read in batches of ``batch_size`` IDs and yielded in
+        the caller's order, so at most one batch of chapter contents is held
+        in memory at a time.
+
+        Args:
+            chap_ids: List of chapter identifiers.
+            batch_size: Number of chapters to load per query.
+
+        Returns:
+            An iterator of ``(chapter_id, chapter)`` pairs, where ``chapter``
+            is a `ChapterDict` or None if the chapter is not stored.
+
+        Raises:
+            ValueError: If ``batch_size`` is less than 1.
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        return self._iter_batches(chap_ids, batch_size)
+
+    def _iter_batches(
+        self, chap_ids: list[str], batch_size: int
+    ) -> Iterator[tuple[str, ChapterDict | None]]:
+        """Yield chapters for `iter_chapters`, one `get_chapters` call per batch."""
+        for i in range(0, len(chap_ids), batch_size):
+            batch = chap_ids[i : i + batch_size]
+            found = self.get_chapters(batch)
+            for cid in batch:
+                yield cid, found[cid]
+
     def delete_chapter(self, chap_id: str) -> bool:
         """Delete a single chapter.
 
@@ -238,7 +315,7 @@ def delete_chapter(self, chap_id: str) -> bool:
             "DELETE FROM chapters WHERE id = ?",
             (chap_id,),
         )
-        self.conn.commit()
+        self._commit()
 
         self._refetch_flags.pop(chap_id, None)
 
@@ -256,27 +333,108 @@ def delete_chapters(self, chap_ids: list[str]) -> int:
         if not chap_ids:
             return 0
 
-        unique_ids = set(chap_ids)
+        unique_ids = list(dict.fromkeys(chap_ids))
 
-        placeholders = ",".join("?" for _ in unique_ids)
-        query = f"DELETE FROM chapters WHERE id IN ({placeholders})"
-        cur = self.conn.execute(query, tuple(unique_ids))
-        self.conn.commit()
+        deleted = 0
+        conn = self.conn
+        for i in range(0, len(unique_ids), _IN_CHUNK_SIZE):
+            chunk = unique_ids[i : i + _IN_CHUNK_SIZE]
+            query = f"DELETE FROM chapters WHERE id IN ({_placeholders(len(chunk))})"
+            cur = conn.execute(query, chunk)
+            deleted += cur.rowcount or 0
+        self._commit()
 
         for cid in unique_ids:
             self._refetch_flags.pop(cid, None)
 
+        return deleted
+
+    def truncate(self) -> int:
+        """Delete all chapters without reclaiming disk space.
+
+        Cheaper than deleting chapters by ID when a store is being rebuilt
+        from scratch; call `vacuum()` afterwards to shrink the file.
+
+        Returns:
+            The number of deleted rows.
+        """
+        cur = self.conn.execute("DELETE FROM chapters")
+        self._commit()
+
+        self._refetch_flags.clear()
+
         return cur.rowcount or 0
 
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[Self]:
+        """Group several writes into a single SQLite transaction.
+
+        Writes made inside the block (``upsert_*`` / ``delete_*`` /
+        ``truncate``) are not committed individually; the transaction is
+        committed once when the outermost block exits, or rolled back if it
+        raises. Nested blocks run in a savepoint, so an error that escapes an
+        inner block undoes only that block's writes, even if an outer block
+        catches it.
+
+        Yields:
+            This storage instance.
+        """
+        conn = self.conn
+        depth = self._tx_depth
+        savepoint = f"novelkit_tx_{depth}"
+        if depth == 0:
+            if conn.in_transaction:
+                conn.commit()
+            conn.execute("BEGIN IMMEDIATE")
+        else:
+            conn.execute(f"SAVEPOINT {savepoint}")
+
+        self._tx_depth = depth + 1
+        try:
+            yield self
+        except BaseException:
+            self._tx_depth = depth
+            if depth == 0:
+                conn.rollback()
+            else:
+                conn.execute(f"ROLLBACK TO {savepoint}")
+                conn.execute(f"RELEASE {savepoint}")
+            self._load_existing_keys()
+            raise
+        self._tx_depth = depth
+
+        if depth > 0:
+            conn.execute(f"RELEASE {savepoint}")
+            return
+        try:
+            conn.commit()
+        except BaseException:
+            # e.g. SQLITE_BUSY: the transaction is still open, discard it
+            conn.rollback()
+            self._load_existing_keys()
+            raise
+
     def vacuum(self) -> None:
-        """Rebuild the SQLite file and reclaim disk space."""
+        """Rebuild the SQLite file and reclaim disk space.
+
+        Raises:
+            RuntimeError: If called inside a `transaction()` block.
+        """
+        if self._tx_depth > 0:
+            raise RuntimeError("Cannot vacuum storage inside a transaction() block.")
         self.conn.execute("VACUUM")
         self.conn.commit()
 
     def close(self) -> None:
-        """Close the database connection and clear caches."""
+        """Close the database connection and clear caches.
+
+        Raises:
+            RuntimeError: If called inside a `transaction()` block.
+        """
         if self._conn is None:
             return
+        if self._tx_depth > 0:
+            raise RuntimeError("Cannot close storage inside a transaction() block.")
 
         with contextlib.suppress(Exception):
             self._conn.close()
@@ -297,6 +455,11 @@ def conn(self) -> sqlite3.Connection:
             )
         return self._conn
 
+    def _commit(self) -> None:
+        """Commit pending writes unless inside a `transaction()` block."""
+        if self._tx_depth == 0:
+            self.conn.commit()
+
     def _load_existing_keys(self) -> None:
         """Populate the in-memory refetch-flag cache from the database."""
         cur = self.conn.execute("SELECT id, need_refetch FROM chapters")
@@ -315,7 +478,7 @@ def _load_dict(data: str) -> dict[str, Any]:
             A dictionary parsed from JSON, or an empty dict on error.
         """
         try:
-            return json.loads(data) or {}
+            return loads(data) or {}
         except Exception:
             return {}
 
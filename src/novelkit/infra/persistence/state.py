@@ -9,6 +9,7 @@
 from typing import Any
 
 from novelkit.infra.paths import STATE_PATH
+from novelkit.libs.filesystem import atomic_write_bytes
 
 
 class StateManager:
@@ -62,11 +63,12 @@ def _load(self) -> dict[str, Any]:
     def _save(self) -> None:
         """Persist current state to disk.
 
-        Ensures the parent directory exists, then writes the JSON file.
+        Ensures the parent directory exists, then atomically replaces the
+        JSON file.
         """
         self._path.parent.mkdir(parents=True, exist_ok=True)
         content = json.dumps(self._data, ensure_ascii=False, indent=2)
-        self._path.write_text(content, encoding="utf-8")
+        atomic_write_bytes(self._path, content.encode("utf-8"))
 
 
 state_mgr = StateManager()
@@ -6,8 +6,15 @@
 components.
 """
 
-__all__ = ["create_session", "BaseSession"]
+__all__ = [
+    "create_session",
+    "get_shared_session",
+    "release_shared_session",
+    "BaseSession",
+]
 
+import asyncio
+import dataclasses
 from typing import Any
 
 from novelkit.schemas import SessionConfig
@@ -54,3 +61,97 @@ def create_session(
             return CurlCffiSession(cfg, **kwargs)
         case _:
             raise ValueError(f"Unsupported backend: {backend!r}")
+
+
+_SharedKey = tuple[str, asyncio.AbstractEventLoop | None, tuple[tuple[str, Any], ...]]
+
+# Pool of shared sessions (per backend, config and event loop) and their
+# reference counts
+_shared_sessions: dict[_SharedKey, BaseSession] = {}
+_shared_refs: dict[int, tuple[_SharedKey, int]] = {}
+
+
+def _shared_key(backend: str, cfg: SessionConfig) -> _SharedKey:
+    items: list[tuple[str, Any]] = []
+    for field in dataclasses.fields(cfg):
+        value = getattr(cfg, field.name)
+        if isinstance(value, dict):
+            value = tuple(sorted(value.items()))
+        items.append((field.name, value))
+
+    # sessions are bound to the loop they were opened on
+    try:
+        loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    return backend, loop, tuple(items)
+
+
+def get_shared_session(
+    backend: str,
+    cfg: SessionConfig | None = None,
+) -> BaseSession:
+    """Returns a session shared by all callers with the same backend and config.
+
+    Reusing one session keeps its connection pool (and established TCP/TLS
+    connections) alive across callers instead of rebuilding it per instance.
+    Each call takes a reference that must be returned with
+    :func:`release_shared_session`; the session is closed once the last
+    reference is released.
+
+    The returned session may not be initialized yet. Callers should
+    ``await session.init()``, which is a no-op for an already open session.
+
+    Sessions are pooled per running event loop, so a session opened under
+    one ``asyncio.run()`` is never handed out under another. Call this from
+    the loop that will use the session.
+
+    Warning:
+        The session, including its cookie jar, is shared by every holder.
+        Cookies set or cleared by one caller are visible to all others using
+        the same backend and config.
+
+    Args:
+        backend: Name of the backend to use. See :func:`create_session`.
+        cfg: Optional session configuration.
+
+    Returns:
+        BaseSession: The shared session instance.
+
+    Raises:
+        ValueError: If the specified backend name is not supported.
+    """
+    cfg = cfg or SessionConfig()
+    key = _shared_key(backend, cfg)
+
+    session = _shared_sessions.get(key)
+    if session is None:
+        session = create_session(backend, cfg)
+        _shared_sessions[key] = session
+
+    _, count = _shared_refs.get(id(session), (key, 0))
+    _shared_refs[id(session)] = (key, count + 1)
+    return session
+
+
+async def release_shared_session(session: BaseSession) -> None:
+    """Releases a reference obtained from :func:`get_shared_session`.
+
+    When the last reference is released the session is removed from the
+    pool and closed. Releasing a session that is not shared is a no-op.
+
+    Args:
+        session: The shared session to release.
+    """
+    entry = _shared_refs.get(id(session))
+    if entry is None:
+        return
+
+    key, count = entry
+    if count > 1:
+        _shared_refs[id(session)] = (key, count - 1)
+        return
+
+    del _shared_refs[id(session)]
+    _shared_sessions.pop(key, None)
+    await session.close()
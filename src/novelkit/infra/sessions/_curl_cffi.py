@@ -31,6 +31,7 @@ async def init(
             proxy_auth = (self._proxy_user, self._proxy_pass)
 
         self._session = AsyncSession(
+            max_clients=self._max_connections,
             headers=self._headers,
             cookies=self._cookies,
             timeout=self._timeout,
@@ -8,11 +8,15 @@
 
 from __future__ import annotations
 
-import json
 from collections import defaultdict
 from collections.abc import Iterator, Mapping, MutableMapping, Sequence
 from typing import Any
 
+from novelkit.libs.json import loads
+
+# Encodings tried, in order, when the declared encoding fails to decode
+_FALLBACK_ENCODINGS = ("gb2312", "gb18030", "gbk", "utf-8")
+
 
 class Headers(MutableMapping[str, str]):
     """A case-insensitive, multi-value HTTP header container.
@@ -90,7 +94,7 @@ class BaseResponse:
         encoding: Default text encoding used when decoding the response body.
     """
 
-    __slots__ = ("content", "headers", "status", "encoding")
+    __slots__ = ("content", "headers", "status", "encoding", "_text_cache")
 
     def __init__(
         self,
@@ -104,6 +108,7 @@ def __init__(
         self.headers = Headers(headers)
         self.status = status
         self.encoding = encoding
+        self._text_cache: tuple[bytes, str, str] | None = None
 
     @property
     def text(self) -> str:
@@ -111,25 +116,45 @@ def text(self) -> str:
 
         The method attempts several common encodings as fallbacks before finally
         decoding with the default encoding using a permissive error handler.
+        The result is cached until ``content`` or ``encoding`` changes.
         """
-        encodings = [self.encoding, "gb2312", "gb18030", "gbk", "utf-8"]
-        for enc in encodings:
+        content, encoding = self.content, self.encoding
+        cache = self._text_cache
+        if cache is not None and cache[0] is content and cache[1] == encoding:
+            return cache[2]
+
+        text = self._decode(content, encoding)
+        self._text_cache = (content, encoding, text)
+        return text
+
+    @staticmethod
+    def _decode(content: bytes, encoding: str) -> str:
+        try:
+            return content.decode(encoding)
+        except (UnicodeDecodeError, LookupError):
+            pass
+        for enc in _FALLBACK_ENCODINGS:
+            if enc == encoding:
+                continue
             try:
-                return self.content.decode(enc)
-            except (UnicodeDecodeError, LookupError):
+                return content.decode(enc)
+            except UnicodeDecodeError:
                 continue
-        return self.content.decode(self.encoding, errors="ignore")
+        return content.decode(encoding, errors="ignore")
 
     def json(self) -> Any:
         """Parses the response text as JSON.
 
+        Uses ``orjson`` when it is installed; very long integers, ``NaN`` and
+        ``Infinity`` are still parsed exactly as `json.loads` would.
+
         Returns:
             Any: The parsed JSON object.
 
         Raises:
             json.JSONDecodeError: If the content is not valid JSON.
         """
-        return json.loads(self.text)
+        return loads(self.text)
 
     @property
     def ok(self) -> bool:
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import struct
+
 from ._mode_base import BaseMode, BlockCipherFunc
 
+_XOR16 = struct.Struct(">QQ")
+
 
 def _xor_bytes(a: bytes, b: bytes) -> bytes:
     """XOR two byte sequences of equal length.
@@ -13,7 +17,23 @@ def _xor_bytes(a: bytes, b: bytes) -> bytes:
     Returns:
         The XOR result as a new byte sequence.
     """
-    return bytes(x ^ y for x, y in zip(a, b, strict=False))
+    n = len(a)
+    return (int.from_bytes(a, "big") ^ int.from_bytes(b, "big")).to_bytes(n, "big")
+
+
+def _xor16(a: bytes, b: bytes) -> bytes:
+    """XOR two 16-byte blocks as a pair of 64-bit integers.
+
+    Args:
+        a: First 16-byte block.
+        b: Second 16-byte block.
+
+    Returns:
+        The XOR result as a new 16-byte block.
+    """
+    a0, a1 = _XOR16.unpack(a)
+    b0, b1 = _XOR16.unpack(b)
+    return _XOR16.pack(a0 ^ b0, a1 ^ b1)
 
 
 class CBCMode(BaseMode):
@@ -39,7 +59,8 @@ def __init__(
             block_size: Block size in bytes. See :class:`BaseMode`.
             iv: Initialization vector. Must be exactly ``block_size`` bytes.
                 If ``None``, a zero IV is used (suitable for tests or learning,
-                but not recommended for real cryptographic use).
+                but not recommended for real cryptographic use). Immutable
+                ``bytes`` are stored as-is; other buffers are copied.
 
         Raises:
             ValueError: If ``iv`` does not match ``block_size``.
@@ -49,7 +70,8 @@ def __init__(
             iv = bytes(block_size)
         if len(iv) != block_size:
             raise ValueError("Invalid IV size")
-        self.iv = bytes(iv)
+        self.iv = iv if isinstance(iv, bytes) else bytes(iv)
+        self._xor = _xor16 if block_size == 16 else _xor_bytes
 
     def encrypt(self, data: bytes) -> bytes:
         """Encrypt data in CBC mode.
@@ -75,11 +97,13 @@ def encrypt(self, data: bytes) -> bytes:
 
         out = bytearray()
         prev = self.iv
+        xor = self._xor
+        encrypt_block = self.encrypt_block
 
         for i in range(0, len(data), bs):
             block = data[i : i + bs]
-            xored = _xor_bytes(block, prev)
-            ct = self.encrypt_block(xored)
+            xored = xor(block, prev)
+            ct = encrypt_block(xored)
             out += ct
             prev = ct
 
@@ -110,11 +134,13 @@ def decrypt(self, data: bytes) -> bytes:
 
         out = bytearray()
         prev = self.iv
+        xor = self._xor
+        decrypt_block = self.decrypt_block
 
         for i in range(0, len(data), bs):
             block = data[i : i + bs]
-            dec = self.decrypt_block(block)
-            pt = _xor_bytes(dec, prev)
+            dec = decrypt_block(block)
+            pt = xor(dec, prev)
             out += pt
             prev = block
 
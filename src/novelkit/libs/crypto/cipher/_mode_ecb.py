@@ -16,6 +16,9 @@ def __init__(
         encrypt_block: BlockCipherFunc,
         decrypt_block: BlockCipherFunc,
         block_size: int,
+        *,
+        enc_table: bytes | None = None,
+        dec_table: bytes | None = None,
     ) -> None:
         """Initialize an ECB mode instance.
 
@@ -23,8 +26,27 @@ def __init__(
             encrypt_block: Block encryption function. See :class:`BaseMode`.
             decrypt_block: Block decryption function. See :class:`BaseMode`.
             block_size: Block size in bytes. See :class:`BaseMode`.
+            enc_table: Optional 256-byte lookup table equivalent to
+                ``encrypt_block`` for single-byte block ciphers. When given,
+                :meth:`encrypt` uses :meth:`bytes.translate` instead of the
+                per-block loop.
+            dec_table: Optional 256-byte lookup table equivalent to
+                ``decrypt_block``, used by :meth:`decrypt` in the same way.
+
+        Raises:
+            ValueError: If a table is given for a block size other than 1, or
+                is not exactly 256 bytes long.
         """
         super().__init__(encrypt_block, decrypt_block, block_size)
+        for table in (enc_table, dec_table):
+            if table is None:
+                continue
+            if block_size != 1:
+                raise ValueError("Lookup tables require a block size of 1")
+            if len(table) != 256:
+                raise ValueError("Lookup table must be 256 bytes")
+        self._enc_table = enc_table
+        self._dec_table = dec_table
 
     def encrypt(self, data: bytes) -> bytes:
         """Encrypt data in ECB mode.
@@ -41,6 +63,9 @@ def encrypt(self, data: bytes) -> bytes:
             ValueError: If the input length is not a multiple of
                 ``block_size``.
         """
+        if self._enc_table is not None:
+            return bytes(data).translate(self._enc_table)
+
         bs = self.block_size
         if len(data) % bs != 0:
             raise ValueError("Data length not a multiple of block size")
@@ -67,6 +92,9 @@ def decrypt(self, data: bytes) -> bytes:
             ValueError: If the input length is not a multiple of
                 ``block_size``.
         """
+        if self._dec_table is not None:
+            return bytes(data).translate(self._dec_table)
+
         bs = self.block_size
         if len(data) % bs != 0:
             raise ValueError("Data length not a multiple of block size")
@@ -1,3 +1,28 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=64)
+def _rc4_init(key: bytes) -> bytes:
+    """Perform the RC4 Key-Scheduling Algorithm (KSA).
+
+    The resulting S-box is cached per key, so repeatedly constructing
+    :class:`RC4` with the same key only runs the KSA once.
+
+    Args:
+        key: RC4 key bytes. Must be hashable (``bytes``).
+
+    Returns:
+        The initial 256-byte S-box.
+    """
+    S = list(range(256))
+    j = 0
+    klen = len(key)
+    for i in range(256):
+        j = (j + S[i] + key[i % klen]) & 0xFF
+        S[i], S[j] = S[j], S[i]
+    return bytes(S)
+
+
 class RC4:
     """Minimal RC4 cipher implementation."""
 
@@ -6,11 +31,13 @@ def __init__(self, key: bytes) -> None:
         Args:
             key: RC4 key bytes (must not be empty).
         """
+        if not isinstance(key, bytes | bytearray | memoryview):
+            raise TypeError(f"Key must be bytes-like, not {type(key).__name__}")
         if not key:
             raise ValueError("Key must not be empty")
 
-        self._key = key
-        self._S0 = self._rc4_init(key)
+        self._key = bytes(key)
+        self._S0 = _rc4_init(self._key)
 
     def crypt(self, data: bytes) -> bytes:
         """Encrypts/Decrypts data
@@ -26,7 +53,7 @@ def crypt(self, data: bytes) -> bytes:
         if not data:
             return b""
 
-        S = self._S0.copy()
+        S = bytearray(self._S0)
         i = 0
         j = 0
         out = bytearray(len(data))
@@ -37,14 +64,3 @@ def crypt(self, data: bytes) -> bytes:
             t = (S[i] + S[j]) & 0xFF
             out[idx] = ch ^ S[t]
         return bytes(out)
-
-    @staticmethod
-    def _rc4_init(key: bytes) -> list[int]:
-        """Perform the RC4 Key-Scheduling Algorithm (KSA)."""
-        S = list(range(256))
-        j = 0
-        klen = len(key)
-        for i in range(256):
-            j = (j + S[i] + key[i % klen]) & 0xFF
-            S[i], S[j] = S[j], S[i]
-        return S
@@ -3,10 +3,12 @@
 """
 
 __all__ = [
+    "atomic_write_bytes",
     "format_filename",
     "url_to_hashed_name",
     "sanitize_filename",
 ]
 
+from .atomic import atomic_write_bytes
 from .filename import format_filename, url_to_hashed_name
 from .sanitize import sanitize_filename
@@ -0,0 +1,56 @@
+"""
+Crash-safe file writing helpers.
+"""
+
+__all__ = ["atomic_write_bytes"]
+
+import contextlib
+import os
+import stat
+import tempfile
+from pathlib import Path
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write *data* to *path* atomically.
+
+    The bytes are written to a uniquely named temporary file in the same
+    directory, flushed to disk with :func:`os.fsync` and then moved into place
+    with :func:`os.replace`, so readers never observe a partially written
+    file and a crash leaves either the old or the new content.
+
+    Symlinks are resolved first, so the link target is replaced and the link
+    itself is kept. The permission bits of an existing file are preserved;
+    new files are created with mode ``0o600``.
+
+    Args:
+        path: Destination file path. The parent directory must exist.
+        data: The bytes to write.
+
+    Raises:
+        OSError: If the temporary file cannot be written or renamed.
+    """
+    target = Path(os.path.realpath(path))
+    try:
+        mode: int | None = stat.S_IMODE(os.stat(target).st_mode)
+    except FileNotFoundError:
+        mode = None
+
+    fd, tmp = tempfile.mkstemp(
+        dir=target.parent, prefix=f".{target.name}.", suffix=".tmp"
+    )
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+            if mode is not None:
+                os.chmod(tmp, mode)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, target)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
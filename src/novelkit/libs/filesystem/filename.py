@@ -1,6 +1,15 @@
 import hashlib
+import string
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from urllib.parse import unquote, urlparse
+from urllib.parse import scheme_chars, unquote, urlparse
+
+# Hash used by `url_to_hashed_name`. Set to "sha1" to reproduce filenames
+# generated by earlier versions.
+_URL_HASH = "blake2b"
+
+_SCHEME_CHARS = frozenset(scheme_chars)
 
 
 class SafeDict(dict[str, str]):
@@ -10,6 +19,27 @@ def __missing__(self, key: str) -> str:
         return f"{{{key}}}"
 
 
+@lru_cache(maxsize=128)
+def _compile_template(template: str) -> tuple[tuple[str, str | None], ...] | None:
+    """Split a template into ``(literal, field_name)`` pairs.
+
+    Returns None if the template uses anything beyond plain ``{name}``
+    fields (format specs, conversions, attribute/index access, positional
+    fields); such templates are rendered with `str.format_map` instead.
+    """
+    try:
+        parsed = list(string.Formatter().parse(template))
+    except ValueError:
+        return None
+
+    parts: list[tuple[str, str | None]] = []
+    for literal, field, spec, conv in parsed:
+        if field is not None and (not field.isidentifier() or spec or conv is not None):
+            return None
+        parts.append((literal, field))
+    return tuple(parts)
+
+
 def format_filename(
     template: str,
     *,
@@ -33,16 +63,79 @@ def format_filename(
     Returns:
         The formatted filename.
     """
-    name = template.format_map(SafeDict(**fields))
+    if not append_timestamp and "{" not in template and "}" not in template:
+        # static template: nothing to substitute
+        return f"{template}{suffix}"
+
+    compiled = _compile_template(template)
+    if compiled is None:
+        name = template.format_map(SafeDict(**fields))
+    else:
+        out: list[str] = []
+        for literal, field in compiled:
+            out.append(literal)
+            if field is not None:
+                if field in fields:
+                    out.append(format(fields[field]))
+                else:
+                    out.append(f"{{{field}}}")
+        name = "".join(out)
 
     if append_timestamp:
-        from datetime import datetime
-
         name += f"_{datetime.now().strftime(timestamp_format)}"
 
     return f"{name}{suffix}"
 
 
+def _parsed_suffix(url: str) -> str:
+    """Return the lowercase URL path extension using the full URL parser."""
+    return Path(unquote(urlparse(url).path)).suffix.lower()
+
+
+def _url_suffix(url: str) -> str:
+    """Return the lowercase file extension of the URL path, or an empty string.
+
+    Mirrors ``Path(unquote(urlparse(url).path)).suffix`` using plain string
+    operations (including `urlsplit`'s scheme and netloc rules). Falls back
+    to the full parse for percent-encoded or ``;params`` paths, for URLs
+    containing characters `urlparse` strips (tab/CR/LF anywhere, leading
+    control characters or spaces) or validates (brackets, non-ASCII), and
+    for paths ending in a ``.`` segment, which `Path` drops.
+    """
+    path = url.partition("#")[0].partition("?")[0]
+    if (
+        "%" in path
+        or ";" in path
+        or "\t" in url
+        or "\r" in url
+        or "\n" in url
+        or url[:1] <= " "
+        or "[" in path
+        or "]" in path
+        or not url.isascii()
+    ):
+        return _parsed_suffix(url)
+
+    colon = path.find(":")
+    if (
+        colon > 0
+        and path[0].isascii()
+        and path[0].isalpha()
+        and _SCHEME_CHARS.issuperset(path[:colon])
+    ):
+        path = path[colon + 1 :]
+    if path.startswith("//"):
+        path = path[2:].partition("/")[2]
+
+    last = path.rstrip("/").rpartition("/")[2]
+    if last == ".":
+        return _parsed_suffix(url)
+    dot = last.rfind(".")
+    if 0 < dot < len(last) - 1:
+        return last[dot:].lower()
+    return ""
+
+
 def url_to_hashed_name(
     url: str,
     *,
@@ -56,19 +149,19 @@ def url_to_hashed_name(
 
     Args:
         url: The URL from which to derive the filename.
-        name: Optional explicit base name. If not provided, the SHA-1 hash
-            of the URL is used.
+        name: Optional explicit base name. If not provided, the BLAKE2b-160
+            hash of the URL is used.
         suffix: Suffix to use when the URL lacks an extension.
 
     Returns:
         The generated filename.
     """
-    parsed = urlparse(url)
-    path = Path(unquote(parsed.path))
-    url_suffix = (path.suffix or "").lower()
-
-    if not url_suffix:
-        url_suffix = suffix
-
-    name = name or hashlib.sha1(url.encode("utf-8")).hexdigest()
+    url_suffix = _url_suffix(url) or suffix
+
+    if not name:
+        data = url.encode("utf-8")
+        if _URL_HASH == "sha1":
+            name = hashlib.sha1(data).hexdigest()
+        else:
+            name = hashlib.blake2b(data, digest_size=20).hexdigest()
     return f"{name}{url_suffix}"
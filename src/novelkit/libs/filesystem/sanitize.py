@@ -6,7 +6,6 @@
 __all__ = ["sanitize_filename"]
 
 import os
-import re
 
 _WIN_RESERVED_NAMES = {
     "CON",
@@ -17,19 +16,28 @@
     *(f"LPT{i}" for i in range(1, 10)),
 }
 
-_SANITIZE_PATTERN_WIN = re.compile(r'[<>:"/\\|?*\x00-\x1F]')
-_SANITIZE_PATTERN_POSIX = re.compile(r"[/\x00]")
+_SANITIZE_TABLE_WIN = str.maketrans(
+    dict.fromkeys([*'<>:"/\\|?*', *map(chr, range(0x20))], "_")
+)
+_SANITIZE_TABLE_POSIX = str.maketrans({"/": "_", "\x00": "_"})
 
 
-def sanitize_filename(filename: str, max_length: int | None = 255) -> str:
-    """Sanitize the given filename by replacing characters that are invalid
-    in file paths with '_'.
+def _truncate(name: str, ext: str, max_length: int | None) -> str:
+    """Cut *name* down to *max_length* while keeping its extension."""
+    if max_length and len(name) > max_length:
+        if ext:
+            keep = max_length - len(ext) - 1
+            return f"{name[:keep]}.{ext}"
+        return name[:max_length]
+    return name
 
-    This function checks the operating system environment and applies the
-    appropriate filtering rules:
 
-    * On Windows, it replaces characters: <>:"/\\|?*
-    * On POSIX systems, it replaces the forward slash '/'
+def _sanitize_win(filename: str, max_length: int | None = 255) -> str:
+    """Sanitize the given filename by replacing characters that are invalid
+    in Windows file paths with '_'.
+
+    Replaces the characters <>:"/\\|?* and control characters, strips
+    trailing spaces and dots, and prefixes reserved device names (e.g. ``CON``).
 
     Args:
         filename: The input filename to sanitize.
@@ -38,23 +46,55 @@ def sanitize_filename(filename: str, max_length: int | None = 255) -> str:
     Returns:
         The sanitized filename.
     """
-    pattern = _SANITIZE_PATTERN_WIN if os.name == "nt" else _SANITIZE_PATTERN_POSIX
-
-    name = pattern.sub("_", filename).strip(" .")
+    name = filename.translate(_SANITIZE_TABLE_WIN).strip(" .")
 
     stem, dot, ext = name.rpartition(".")
     if dot == "":  # no dot found
         stem, ext = name, ""
-        dot = ""
-    if os.name == "nt" and stem.upper() in _WIN_RESERVED_NAMES:
+    if stem.upper() in _WIN_RESERVED_NAMES:
         stem = f"_{stem}"
-    cleaned = f"{stem}{dot}{ext}" if ext else stem
+    cleaned = f"{stem}.{ext}" if ext else stem
 
-    if max_length and len(cleaned) > max_length:
-        if ext:
-            keep = max_length - len(ext) - 1
-            cleaned = f"{cleaned[:keep]}.{ext}"
-        else:
-            cleaned = cleaned[:max_length]
+    return _truncate(cleaned, ext, max_length) or "_untitled"
+
+
+def _sanitize_posix(filename: str, max_length: int | None = 255) -> str:
+    """Sanitize the given filename by replacing characters that are invalid
+    in POSIX file paths ('/' and NUL) with '_'.
+
+    Args:
+        filename: The input filename to sanitize.
+        max_length: Maximum allowed length of the sanitized filename. Defaults to 255.
+
+    Returns:
+        The sanitized filename.
+    """
+    name = filename.translate(_SANITIZE_TABLE_POSIX).strip(" .")
+
+    _, dot, ext = name.rpartition(".")
+    return _truncate(name, ext if dot else "", max_length) or "_untitled"
+
+
+# ``os.name`` cannot change at runtime, so pick the implementation once.
+_sanitize_impl = _sanitize_win if os.name == "nt" else _sanitize_posix
+
+
+def sanitize_filename(filename: str, max_length: int | None = 255) -> str:
+    """Sanitize the given filename by replacing characters that are invalid
+    in file paths with '_'.
 
-    return cleaned or "_untitled"
+    The filtering rules for the current operating system are selected once
+    at import time:
+
+    * On Windows, it replaces characters: <>:"/\\|?* and control
+      characters, and prefixes reserved device names (e.g. ``CON``)
+    * On POSIX systems, it replaces the forward slash '/' and NUL
+
+    Args:
+        filename: The input filename to sanitize.
+        max_length: Maximum allowed length of the sanitized filename. Defaults to 255.
+
+    Returns:
+        The sanitized filename.
+    """
+    return _sanitize_impl(filename, max_length)
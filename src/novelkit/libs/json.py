@@ -0,0 +1,123 @@
+"""
+JSON helpers that use ``orjson`` when it is installed.
+
+``orjson`` is an optional speedup (the ``speedups`` extra). Whether it is
+installed does not change which inputs are accepted or what they decode to:
+anything ``orjson`` would treat differently from the standard library is
+handed to :mod:`json` instead.
+"""
+
+from __future__ import annotations
+
+__all__ = ["dumps", "loads"]
+
+import json
+import re
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+# orjson parses integers outside the 64-bit range as floats; a run of 20+
+# digits is the only way such a number can appear in the text.
+_LONG_DIGITS = re.compile(r"\d{20}")
+_LONG_DIGITS_BYTES = re.compile(rb"\d{20}")
+
+_INT_MIN = -(2**63)
+_UINT_MAX = 2**64 - 1
+_PLAIN_SCALARS = frozenset({str, bool, type(None)})
+
+if orjson is not None:
+    # Make orjson raise on types the standard library would reject
+    _ORJSON_OPTS = (
+        orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+
+def _is_plain(obj: Any) -> bool:
+    """Return True if *obj* only holds values orjson encodes like `json`.
+
+    That is exact ``dict`` (with ``str`` keys), ``list``, ``tuple``, ``str``,
+    ``bool``, ``None``, finite ``float`` and ``int`` within the 64-bit range.
+    Anything else (subclasses, ``Enum``, ``UUID``, ``datetime``, numpy
+    values, ``NaN``...) needs the standard library's handling.
+    """
+    stack = [obj]
+    pop, extend = stack.pop, stack.extend
+    while stack:
+        o = pop()
+        t = type(o)
+        if t is str:
+            continue
+        if t is dict:
+            for k in o:
+                if type(k) is not str:
+                    return False
+            extend(o.values())
+        elif t is list or t is tuple:
+            extend(o)
+        elif t is int:
+            if not _INT_MIN <= o <= _UINT_MAX:
+                return False
+        elif t is float:
+            if o - o != 0.0:  # NaN or +/-Infinity
+                return False
+        elif t not in _PLAIN_SCALARS:
+            return False
+    return True
+
+
+def dumps(obj: Any) -> str:
+    """Serialize *obj* to a compact JSON string.
+
+    Plain JSON data is encoded by ``orjson`` when available. Everything else
+    goes through :func:`json.dumps` with compact separators, so the set of
+    accepted objects and the decoded result are the same with or without
+    ``orjson``: non-string keys are stringified, ``NaN`` is written as
+    ``NaN``, and types such as ``datetime``, ``UUID`` or ``Enum`` raise
+    `TypeError`. Checking for plain data costs one pass over *obj*.
+
+    Args:
+        obj: The object to serialize.
+
+    Returns:
+        The JSON document as a string.
+
+    Raises:
+        TypeError: If *obj* is not JSON serializable.
+    """
+    if orjson is not None and _is_plain(obj):
+        return orjson.dumps(obj, option=_ORJSON_OPTS).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document.
+
+    Documents with very long integers, ``NaN`` or ``Infinity`` are parsed by
+    :mod:`json`, so big integers keep their exact value.
+
+    Args:
+        data: The JSON document.
+
+    Returns:
+        The parsed object.
+
+    Raises:
+        json.JSONDecodeError: If *data* is not valid JSON.
+    """
+    if orjson is not None:
+        if isinstance(data, bytes):
+            has_long_int = _LONG_DIGITS_BYTES.search(data) is not None
+        else:
+            has_long_int = _LONG_DIGITS.search(data) is not None
+        if not has_long_int:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(data)
@@ -1,5 +1,5 @@
 import json
-from pathlib import Path
+import os
 
 import pytest
 
@@ -188,14 +188,15 @@ def test_save_config_creates_parent_and_saves(tmp_path):
 def test_save_config_failure_propagates(tmp_path, monkeypatch):
     outfile = tmp_path / "cannot_write.json"
 
-    # Cause open() to fail intentionally
+    # Cause the low-level open() to fail intentionally
     def fake_open(*args, **kwargs):
         raise OSError("write fail")
 
-    monkeypatch.setattr(Path, "open", fake_open)
+    monkeypatch.setattr(os, "open", fake_open)
 
     with pytest.raises(OSError):
         save_config({"a": 1}, outfile)
+    assert not outfile.exists()
 
 
 # ================================================================
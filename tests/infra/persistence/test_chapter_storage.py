@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import math
+import sqlite3
 from pathlib import Path
 
 import pytest
 
 from novelkit.infra.persistence.chapter_storage import ChapterStorage
+from novelkit.libs import json as json_mod
 from novelkit.schemas import ChapterDict
 
 
@@ -52,6 +55,92 @@ def test_upsert_and_get_single(tmp_storage):
     assert got["extra"] == {"i": 1}
 
 
+def test_extra_roundtrip_unicode(tmp_storage):
+    chapter = _make_chapter(1)
+    chapter["extra"] = {"作者": "张三", "tags": ["玄幻", "修仙"], "n": 1.5}
+    tmp_storage.upsert_chapter(chapter)
+
+    got = tmp_storage.get_chapter("chap1")
+    assert got is not None
+    assert got["extra"] == {"作者": "张三", "tags": ["玄幻", "修仙"], "n": 1.5}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_extra_roundtrip_big_int_and_nan(tmp_storage, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(json_mod, "orjson", None)
+
+    chapter = _make_chapter(1)
+    chapter["extra"] = {"big": 2**70, "nan": float("nan"), "none": None}
+    tmp_storage.upsert_chapter(chapter)
+
+    got = tmp_storage.get_chapter("chap1")
+    assert got is not None
+    assert got["extra"]["big"] == 2**70
+    assert math.isnan(got["extra"]["nan"])
+    assert got["extra"]["none"] is None
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_reads_legacy_nan_extra(tmp_storage, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(json_mod, "orjson", None)
+
+    tmp_storage.upsert_chapter(_make_chapter(1))
+    # rows written by the stdlib encoder may contain NaN literals
+    tmp_storage.conn.execute(
+        "UPDATE chapters SET extra = ? WHERE id = ?",
+        ('{"score": NaN, "id": 123456789012345678901234567890}', "chap1"),
+    )
+
+    got = tmp_storage.get_chapter("chap1")
+    assert got is not None
+    assert math.isnan(got["extra"]["score"])
+    assert got["extra"]["id"] == 123456789012345678901234567890
+
+
+def test_need_refetch_many(tmp_storage):
+    tmp_storage.upsert_chapter(_make_chapter(1), need_refetch=False)
+    tmp_storage.upsert_chapter(_make_chapter(2), need_refetch=True)
+
+    ids = ["chap1", "chap2", "missing"]
+    assert tmp_storage.need_refetch_many(ids) == {"chap2", "missing"}
+    assert tmp_storage.need_refetch_many([]) == set()
+
+
+def test_get_and_delete_chapters_beyond_chunk_size(tmp_storage):
+    chapters = [_make_chapter(i) for i in range(2000)]
+    tmp_storage.upsert_chapters(chapters)
+
+    ids = [c["id"] for c in reversed(chapters)] + ["missing"]
+    result = tmp_storage.get_chapters(ids)
+    assert list(result) == ids  # caller order preserved
+    assert result["missing"] is None
+    assert result["chap1999"]["extra"] == {"i": 1999}
+
+    assert tmp_storage.delete_chapters(ids) == 2000
+    assert tmp_storage.existing_ids() == set()
+
+
+def test_iter_chapters_batches_in_order(tmp_storage):
+    tmp_storage.upsert_chapters([_make_chapter(i) for i in range(5)])
+
+    ids = ["chap4", "missing", "chap0", "chap2", "chap0"]
+    result = list(tmp_storage.iter_chapters(ids, batch_size=2))
+
+    assert [cid for cid, _ in result] == ids
+    assert result[1][1] is None
+    assert result[2][1]["title"] == "Title 0"
+    assert result[4][1]["title"] == "Title 0"
+    assert list(tmp_storage.iter_chapters([])) == []
+
+
+@pytest.mark.parametrize("batch_size", [0, -1])
+def test_iter_chapters_rejects_bad_batch_size(tmp_storage, batch_size):
+    with pytest.raises(ValueError, match="batch_size"):
+        tmp_storage.iter_chapters(["chap0"], batch_size=batch_size)
+
+
 def test_get_missing_returns_none(tmp_storage):
     assert tmp_storage.get_chapter("missing") is None
 
@@ -159,3 +248,100 @@ def test_get_chapters_empty_list(tmp_storage):
 def test_delete_chapters_empty_list(tmp_storage):
     assert tmp_storage.delete_chapters([]) == 0
     assert tmp_storage.existing_ids() == set()
+
+
+def test_transaction_commits_once(tmp_path):
+    db = tmp_path / "tx.sqlite"
+    with ChapterStorage(db) as store:
+        with store.transaction():
+            store.upsert_chapters([_make_chapter(0)])
+            with store.transaction():
+                store.upsert_chapter(_make_chapter(1), need_refetch=True)
+            assert store.conn.in_transaction
+        assert not store.conn.in_transaction
+
+    with ChapterStorage(db) as store:
+        assert store.existing_ids() == {"chap0", "chap1"}
+        assert store.dirty_ids() == {"chap1"}
+
+
+def test_transaction_rolls_back_on_error(tmp_storage):
+    tmp_storage.upsert_chapter(_make_chapter(0))
+
+    with pytest.raises(RuntimeError), tmp_storage.transaction():
+        tmp_storage.upsert_chapter(_make_chapter(1))
+        tmp_storage.delete_chapter("chap0")
+        raise RuntimeError("boom")
+
+    assert tmp_storage.existing_ids() == {"chap0"}
+    assert tmp_storage.get_chapter("chap1") is None
+
+
+def test_connect_enables_wal(tmp_storage):
+    conn = tmp_storage.conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+
+def test_truncate_removes_all(tmp_storage):
+    tmp_storage.upsert_chapters([_make_chapter(i) for i in range(3)])
+
+    assert tmp_storage.truncate() == 3
+    assert tmp_storage.existing_ids() == set()
+    assert tmp_storage.get_chapter("chap0") is None
+    assert tmp_storage.truncate() == 0
+
+
+def test_close_inside_transaction_raises(tmp_storage):
+    with tmp_storage.transaction():
+        tmp_storage.upsert_chapter(_make_chapter(0))
+        with pytest.raises(RuntimeError, match="transaction"):
+            tmp_storage.close()
+
+    assert tmp_storage.existing_ids() == {"chap0"}
+    tmp_storage.close()
+
+
+def test_nested_transaction_rolls_back_inner_block_only(tmp_path):
+    db = tmp_path / "tx.sqlite"
+    with ChapterStorage(db) as store, store.transaction():
+        store.upsert_chapter(_make_chapter(0))
+        with pytest.raises(ValueError), store.transaction():
+            store.upsert_chapter(_make_chapter(1))
+            raise ValueError("inner")
+        assert store.existing_ids() == {"chap0"}
+        store.upsert_chapter(_make_chapter(2))
+
+    with ChapterStorage(db) as store:
+        assert store.existing_ids() == {"chap0", "chap2"}
+
+
+class _FailingCommitConn:
+    def __init__(self, conn):
+        self._conn = conn
+
+    def commit(self):
+        raise sqlite3.OperationalError("database is locked")
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+def test_transaction_commit_failure_rolls_back(tmp_storage):
+    real = tmp_storage._conn
+    tmp_storage._conn = _FailingCommitConn(real)
+    try:
+        with pytest.raises(sqlite3.OperationalError), tmp_storage.transaction():
+            tmp_storage.upsert_chapter(_make_chapter(0))
+    finally:
+        tmp_storage._conn = real
+
+    assert not real.in_transaction
+    assert tmp_storage.existing_ids() == set()
+    assert tmp_storage.get_chapter("chap0") is None
+
+
+def test_vacuum_inside_transaction_raises(tmp_storage):
+    with tmp_storage.transaction(), pytest.raises(RuntimeError, match="transaction"):
+        tmp_storage.vacuum()
+    tmp_storage.vacuum()
@@ -1,3 +1,5 @@
+import math
+
 import pytest
 
 from novelkit.infra.sessions.response import BaseResponse, Headers
@@ -103,6 +105,16 @@ def test_base_response_invalid_bytes_fallback():
     assert isinstance(resp.text, str)
 
 
+def test_base_response_text_cache_tracks_content_and_encoding():
+    resp = BaseResponse(content="中文".encode("big5"), encoding="big5")
+    assert resp.text == "中文"
+    assert resp.text is resp.text  # cached
+
+    resp.content = "编码".encode("gbk")
+    resp.encoding = "gbk"
+    assert resp.text == "编码"
+
+
 def test_base_response_json():
     resp = BaseResponse(content=b'{"a": 1}', encoding="utf-8")
     assert resp.json() == {"a": 1}
@@ -114,6 +126,16 @@ def test_base_response_json_invalid():
         resp.json()
 
 
+def test_base_response_json_matches_stdlib_edge_cases():
+    resp = BaseResponse(
+        content=b'{"id": 123456789012345678901234567890, "s": NaN}',
+        encoding="utf-8",
+    )
+    data = resp.json()
+    assert data["id"] == 123456789012345678901234567890
+    assert math.isnan(data["s"])
+
+
 def test_base_response_ok_property():
     assert BaseResponse(content=b"", status=200).ok is True
     assert BaseResponse(content=b"", status=399).ok is True
@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from novelkit.infra.sessions import get_shared_session, release_shared_session
+from novelkit.schemas import SessionConfig
+
+from .utils import SUPPORTED_BACKENDS, safe_create
+
+
+def _shared(backend: str, cfg: SessionConfig):
+    try:
+        return get_shared_session(backend, cfg)
+    except ImportError as e:
+        pytest.skip(f"backend {backend!r} not installed: {e}")
+
+
+@pytest.mark.parametrize("backend", sorted(SUPPORTED_BACKENDS))
+@pytest.mark.asyncio
+async def test_shared_session_is_reused_for_equal_config(backend):
+    a = _shared(backend, SessionConfig(headers={"X-A": "1"}))
+    b = _shared(backend, SessionConfig(headers={"X-A": "1"}))
+    assert a is b
+
+    await release_shared_session(a)
+    await release_shared_session(b)
+
+
+@pytest.mark.parametrize("backend", sorted(SUPPORTED_BACKENDS))
+@pytest.mark.asyncio
+async def test_shared_session_differs_by_config(backend):
+    a = _shared(backend, SessionConfig(timeout=5.0))
+    b = _shared(backend, SessionConfig(timeout=6.0))
+    assert a is not b
+
+    await release_shared_session(a)
+    await release_shared_session(b)
+
+
+@pytest.mark.parametrize("backend", sorted(SUPPORTED_BACKENDS))
+@pytest.mark.asyncio
+async def test_shared_session_closed_after_last_release(backend):
+    cfg = SessionConfig()
+    a = _shared(backend, cfg)
+    b = _shared(backend, cfg)
+    await a.init()
+
+    await release_shared_session(a)
+    assert a._session is not None  # still referenced by `b`
+
+    await release_shared_session(b)
+    assert a._session is None
+
+    # A fresh session is created once the pooled one is gone
+    c = _shared(backend, cfg)
+    assert c is not a
+    await release_shared_session(c)
+
+
+@pytest.mark.asyncio
+async def test_release_unshared_session_is_noop():
+    s = safe_create("aiohttp", SessionConfig())
+    await s.init()
+
+    await release_shared_session(s)
+    assert s._session is not None
+    await s.close()
+
+
+@pytest.mark.parametrize("backend", sorted(SUPPORTED_BACKENDS))
+@pytest.mark.asyncio
+async def test_shared_session_ignores_header_order(backend):
+    a = _shared(backend, SessionConfig(headers={"A": "1", "B": "2"}))
+    b = _shared(backend, SessionConfig(headers={"B": "2", "A": "1"}))
+    assert a is b
+
+    await release_shared_session(a)
+    await release_shared_session(b)
+
+
+@pytest.mark.parametrize("backend", sorted(SUPPORTED_BACKENDS))
+def test_shared_session_not_reused_across_event_loops(backend):
+    cfg = SessionConfig(timeout=7.0)
+
+    async def acquire():
+        return _shared(backend, cfg)
+
+    a = asyncio.run(acquire())
+    b = asyncio.run(acquire())
+    try:
+        assert a is not b
+    finally:
+        asyncio.run(release_shared_session(a))
+        asyncio.run(release_shared_session(b))
@@ -45,3 +45,10 @@ def test_parse_cookies_invalid_type(bad_input):
     """Non-str and non-mapping inputs should raise TypeError."""
     with pytest.raises(TypeError):
         parse_cookies(bad_input)
+
+
+def test_parse_cookies_string_result_is_independent():
+    """Cached parsing must still hand out a fresh dict on every call."""
+    first = parse_cookies("a=1; b=2")
+    first["a"] = "changed"
+    assert parse_cookies("a=1; b=2") == {"a": "1", "b": "2"}
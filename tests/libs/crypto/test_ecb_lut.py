@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from novelkit.libs.crypto.cipher._mode_ecb import ECBMode
+
+_rng = random.Random(20251124)
+
+_PERM = list(range(256))
+_rng.shuffle(_PERM)
+ENC_TABLE = bytes(_PERM)
+DEC_TABLE = bytes(_PERM.index(i) for i in range(256))
+
+
+def _enc_block(block: bytes) -> bytes:
+    return bytes([ENC_TABLE[block[0]]])
+
+
+def _dec_block(block: bytes) -> bytes:
+    return bytes([DEC_TABLE[block[0]]])
+
+
+@pytest.mark.parametrize("n", [0, 1, 7, 256, 1000])
+def test_ecb_lut_matches_block_loop(n):
+    data = bytes(_rng.randrange(0, 256) for _ in range(n))
+
+    plain = ECBMode(_enc_block, _dec_block, 1)
+    fast = ECBMode(_enc_block, _dec_block, 1, enc_table=ENC_TABLE, dec_table=DEC_TABLE)
+
+    ct = fast.encrypt(data)
+    assert ct == plain.encrypt(data)
+    assert fast.decrypt(ct) == plain.decrypt(ct) == data
+
+
+def test_ecb_lut_requires_single_byte_blocks():
+    with pytest.raises(ValueError):
+        ECBMode(_enc_block, _dec_block, 16, enc_table=ENC_TABLE)
+
+
+def test_ecb_lut_requires_full_table():
+    with pytest.raises(ValueError):
+        ECBMode(_enc_block, _dec_block, 1, dec_table=DEC_TABLE[:255])
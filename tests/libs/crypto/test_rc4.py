@@ -317,6 +317,18 @@ def test_rc4_rejects_empty_key():
         RC4(b"")
 
 
+@pytest.mark.parametrize("key", [4, 0, "key", [1, 2, 3]])
+def test_rc4_rejects_non_bytes_key(key):
+    with pytest.raises(TypeError):
+        RC4(key)
+
+
+def test_rc4_accepts_bytes_like_keys():
+    expected = RC4(b"secret").crypt(b"data")
+    assert RC4(bytearray(b"secret")).crypt(b"data") == expected
+    assert RC4(memoryview(b"secret")).crypt(b"data") == expected
+
+
 def test_rc4_accepts_empty_data_and_returns_empty_bytes():
     key = b"nonempty"
     rc4 = RC4(key)
@@ -0,0 +1,107 @@
+import os
+import stat
+import threading
+
+import pytest
+
+from novelkit.libs.filesystem.atomic import atomic_write_bytes
+
+
+def test_atomic_write_creates_file(tmp_path):
+    path = tmp_path / "out.json"
+    atomic_write_bytes(path, b'{"a": 1}')
+
+    assert path.read_bytes() == b'{"a": 1}'
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_atomic_write_replaces_existing(tmp_path):
+    path = tmp_path / "out.json"
+    path.write_bytes(b"old content that is longer")
+
+    atomic_write_bytes(path, b"new")
+    assert path.read_bytes() == b"new"
+
+
+def test_atomic_write_empty_data(tmp_path):
+    path = tmp_path / "empty.bin"
+    atomic_write_bytes(path, b"")
+    assert path.read_bytes() == b""
+
+
+def test_atomic_write_failure_keeps_original(tmp_path, monkeypatch):
+    path = tmp_path / "out.json"
+    path.write_bytes(b"original")
+
+    def fake_write(fd, data):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "write", fake_write)
+
+    with pytest.raises(OSError):
+        atomic_write_bytes(path, b"new")
+
+    assert path.read_bytes() == b"original"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_atomic_write_fsyncs_before_replace(tmp_path, monkeypatch):
+    calls = []
+    real_fsync, real_replace = os.fsync, os.replace
+
+    def fake_fsync(fd):
+        calls.append("fsync")
+        real_fsync(fd)
+
+    def fake_replace(src, dst):
+        calls.append("replace")
+        real_replace(src, dst)
+
+    monkeypatch.setattr(os, "fsync", fake_fsync)
+    monkeypatch.setattr(os, "replace", fake_replace)
+
+    atomic_write_bytes(tmp_path / "out.json", b"data")
+    assert calls == ["fsync", "replace"]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+def test_atomic_write_preserves_mode(tmp_path):
+    path = tmp_path / "settings.json"
+    path.write_bytes(b"secret")
+    path.chmod(0o600)
+
+    atomic_write_bytes(path, b"new secret")
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+    path.chmod(0o640)
+    atomic_write_bytes(path, b"newer")
+    assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+
+@pytest.mark.skipif(os.name == "nt", reason="symlinks need privileges on Windows")
+def test_atomic_write_follows_symlink(tmp_path):
+    real = tmp_path / "real.json"
+    real.write_bytes(b"old")
+    link = tmp_path / "link.json"
+    link.symlink_to(real)
+
+    atomic_write_bytes(link, b"new")
+
+    assert link.is_symlink()
+    assert real.read_bytes() == b"new"
+
+
+def test_atomic_write_concurrent_writers(tmp_path):
+    path = tmp_path / "state.json"
+    payloads = [bytes([i]) * 4096 for i in range(8)]
+
+    threads = [
+        threading.Thread(target=atomic_write_bytes, args=(path, p)) for p in payloads
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert path.read_bytes() in payloads
+    assert list(tmp_path.iterdir()) == [path]
@@ -1,6 +1,7 @@
 import hashlib
 import re
 
+from novelkit.libs.filesystem import filename as filename_mod
 from novelkit.libs.filesystem.filename import (
     SafeDict,
     format_filename,
@@ -48,6 +49,43 @@ def test_format_filename_with_ext_no_timestamp():
     assert result == "file.txt"
 
 
+def test_format_filename_static_template_ignores_fields():
+    result = format_filename("file", suffix=".txt", name="unused")
+    assert result == "file.txt"
+
+
+def test_format_filename_escaped_braces_still_formatted():
+    result = format_filename("file_{{x}}_{name}", name="a")
+    assert result == "file_{x}_a"
+
+
+def test_format_filename_compiled_template_matches_format_map():
+    template = "{title}_{{v}}_{author}_{missing}"
+    fields = {"title": "Book", "author": "Someone"}
+    expected = template.format_map(SafeDict(**fields))
+
+    for _ in range(2):  # second call hits the compiled-template cache
+        assert format_filename(template, **fields) == expected
+
+
+def test_format_filename_compiled_template_renders_none_and_format():
+    class Custom:
+        def __format__(self, spec):
+            return "custom"
+
+    template = "{a}_{b}_{c}"
+    fields = {"a": None, "b": Custom(), "c": 3}
+    expected = template.format_map(SafeDict(**fields))
+
+    assert expected == "None_custom_3"
+    assert format_filename(template, **fields) == expected
+
+
+def test_format_filename_format_spec_falls_back():
+    assert format_filename("{n:>3}", n="7") == "  7"
+    assert format_filename("{missing!r}") == "'{missing}'"
+
+
 # -------------------------------------------------------------
 # url_to_hashed_name
 # -------------------------------------------------------------
@@ -78,7 +116,48 @@ def test_url_to_hashed_name_name_and_suffix_but_url_has_extension():
 
 
 def test_url_to_hashed_name_hash_fallback():
+    url = "https://example.com/path/file"
+    result = url_to_hashed_name(url)
+    hash_value = hashlib.blake2b(url.encode("utf-8"), digest_size=20).hexdigest()
+    assert result == f"{hash_value}.bin"
+
+
+def test_url_to_hashed_name_sha1_compat(monkeypatch):
+    monkeypatch.setattr(filename_mod, "_URL_HASH", "sha1")
     url = "https://example.com/path/file"
     result = url_to_hashed_name(url)
     hash_value = hashlib.sha1(url.encode("utf-8")).hexdigest()
-    assert result.startswith(hash_value)
+    assert result == f"{hash_value}.bin"
+
+
+def test_url_to_hashed_name_ignores_query_and_fragment():
+    url = "https://example.com/path/IMG.PNG?v=1.2#frag.x"
+    result = url_to_hashed_name(url, name="img")
+    assert result == "img.png"
+
+
+def test_url_to_hashed_name_host_only_uses_fallback_suffix():
+    result = url_to_hashed_name("https://example.com", name="root")
+    assert result == "root.bin"
+
+
+def test_url_to_hashed_name_percent_encoded_path():
+    url = "https://example.com/%E5%9B%BE.JPG"
+    result = url_to_hashed_name(url, name="pic")
+    assert result == "pic.jpg"
+
+
+def test_url_to_hashed_name_strips_tab_and_newlines_like_urlparse():
+    url = "https://example.com/path/im\tage.png\r\n"
+    result = url_to_hashed_name(url, name="img")
+    assert result == "img.png"
+
+
+def test_url_to_hashed_name_relative_path_containing_scheme():
+    result = url_to_hashed_name("/foo/http://x.html", name="page")
+    assert result == "page.html"
+
+
+def test_url_to_hashed_name_trailing_dot_segment():
+    result = url_to_hashed_name("https://h/a/b.jpg/.", name="pic")
+    assert result == "pic.jpg"
@@ -2,7 +2,7 @@
 
 import pytest
 
-from novelkit.libs.filesystem.sanitize import sanitize_filename
+from novelkit.libs.filesystem.sanitize import _sanitize_win, sanitize_filename
 
 
 def test_empty_filename_becomes_untitled():
@@ -53,3 +53,13 @@ def test_posix_illegal_slash_replaced(self):
 
     def test_posix_no_reserved_word_handling(self):
         assert sanitize_filename("CON.txt") == "CON.txt"
+
+    def test_posix_null_byte_replaced(self):
+        assert sanitize_filename("a\x00b.txt") == "a_b.txt"
+
+
+def test_windows_rules_replace_control_chars():
+    # Exercise the Windows variant directly so it is covered on every OS
+    assert _sanitize_win("a\x01b\x1fc\td.txt") == "a_b_c_d.txt"
+    assert _sanitize_win('a<b>c:"d"|e?f*g\\h.txt') == "a_b_c__d__e_f_g_h.txt"
+    assert _sanitize_win("nul") == "_nul"
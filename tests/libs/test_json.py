@@ -0,0 +1,99 @@
+import enum
+import json
+import math
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+
+import pytest
+
+from novelkit.libs import json as json_mod
+
+
+class _Color(enum.Enum):
+    RED = "red"
+
+
+class _Num(enum.IntEnum):
+    ONE = 1
+
+
+@dataclass
+class _Point:
+    x: int
+    y: int
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(json_mod, "orjson", None)
+    elif json_mod.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+def test_roundtrip_plain(backend):
+    obj = {"作者": "张三", "tags": ["a", "b"], "n": 1.5, "ok": True}
+    assert json_mod.loads(json_mod.dumps(obj)) == obj
+
+
+def test_dumps_non_str_keys(backend):
+    assert json_mod.loads(json_mod.dumps({1: "a"})) == {"1": "a"}
+
+
+def test_dumps_big_int_and_nan(backend):
+    text = json_mod.dumps({"big": 2**70, "nan": float("nan"), "none": None})
+    got = json.loads(text)
+    assert got["big"] == 2**70
+    assert math.isnan(got["nan"])
+    assert got["none"] is None
+
+
+@pytest.mark.parametrize("as_bytes", [False, True])
+def test_loads_keeps_big_int_precision(backend, as_bytes):
+    text = '{"id": 123456789012345678901234567890}'
+    data = text.encode() if as_bytes else text
+    assert json_mod.loads(data) == {"id": 123456789012345678901234567890}
+
+
+def test_loads_accepts_nan_and_infinity(backend):
+    got = json_mod.loads("[NaN, Infinity, -Infinity]")
+    assert math.isnan(got[0])
+    assert got[1:] == [math.inf, -math.inf]
+
+
+def test_loads_invalid_raises_json_error(backend):
+    with pytest.raises(json.JSONDecodeError):
+        json_mod.loads("{ invalid")
+
+
+def test_dumps_unserializable_raises_type_error(backend):
+    with pytest.raises(TypeError):
+        json_mod.dumps({"x": object()})
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        datetime(2024, 1, 1),
+        uuid.UUID(int=1),
+        _Color.RED,
+        _Point(1, 2),
+        {_Color.RED: 1},
+    ],
+)
+def test_dumps_rejects_non_json_types(backend, value):
+    with pytest.raises(TypeError):
+        json_mod.dumps({"v": value})
+
+
+def test_dumps_same_output_for_both_backends(monkeypatch):
+    obj = {"a": [1, 2.5, None, True], "b": {"作者": "张三"}, "n": _Num.ONE}
+    fast = json_mod.dumps(obj)
+    monkeypatch.setattr(json_mod, "orjson", None)
+    assert (
+        json_mod.dumps(obj)
+        == fast
+        == '{"a":[1,2.5,null,true],"b":{"作者":"张三"},"n":1}'
+    )